@@ -0,0 +1,76 @@
+"""Compare the old per-frame PhotoImage path with the FrameRenderer paste path.
+
+Feeds synthetic BGR frames through both paths without a camera or server and
+reports render FPS and process CPU time. Needs a display for Tk.
+
+    python benchmark_render.py --frames 300 --width 640 --height 480
+"""
+import argparse
+import time
+import tkinter as tk
+import cv2
+import numpy as np
+from PIL import Image, ImageTk
+from frame_renderer import FrameRenderer
+
+
+def make_frames(width, height, count=8):
+    """Build a small set of synthetic BGR frames to cycle through."""
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(count)]
+
+
+def render_per_frame_photo(label, frame):
+    """Old path: convert and allocate a new PhotoImage for every frame."""
+    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    img = Image.fromarray(frame_rgb)
+    imgtk = ImageTk.PhotoImage(image=img)
+    label.imgtk = imgtk
+    label.config(image=imgtk)
+
+
+def run(root, render, frames, count):
+    """Render count frames and return (fps, cpu_seconds)."""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    for i in range(count):
+        render(frames[i % len(frames)])
+        root.update_idletasks()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    return count / wall, cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300, help="frames to render per path")
+    parser.add_argument("--width", type=int, default=640, help="synthetic frame width")
+    parser.add_argument("--height", type=int, default=480, help="synthetic frame height")
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    root.geometry("600x560")
+    frames = make_frames(args.width, args.height)
+
+    old_label = tk.Label(root, borderwidth=0, highlightthickness=0)
+    old_label.pack(fill=tk.BOTH, expand=True)
+    root.update()
+    old_fps, old_cpu = run(root, lambda frame: render_per_frame_photo(old_label, frame), frames, args.frames)
+    old_label.destroy()
+
+    new_label = tk.Label(root, borderwidth=0, highlightthickness=0)
+    new_label.pack(fill=tk.BOTH, expand=True)
+    renderer = FrameRenderer(new_label)
+    root.update()
+    new_fps, new_cpu = run(root, renderer.render, frames, args.frames)
+    root.destroy()
+
+    print(f"{args.frames} frames of {args.width}x{args.height}")
+    print(f"per-frame PhotoImage: {old_fps:8.1f} FPS  {old_cpu:6.2f} s CPU  "
+          f"{1000 * old_cpu / args.frames:6.2f} ms CPU/frame")
+    print(f"reused PhotoImage:    {new_fps:8.1f} FPS  {new_cpu:6.2f} s CPU  "
+          f"{1000 * new_cpu / args.frames:6.2f} ms CPU/frame")
+
+
+if __name__ == "__main__":
+    main()
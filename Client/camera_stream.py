@@ -0,0 +1,64 @@
+import threading
+import time
+import cv2
+
+
+class CameraStream:
+    """A class for reading camera frames on a single background thread."""
+
+    RETRY_DELAY = 0.01
+    MAX_RETRY_DELAY = 0.5
+
+    def __init__(self, device=0):
+        """Open the capture device; call start() to begin reading frames."""
+        self.cap = cv2.VideoCapture(device)
+        self.running = False
+        self.frame = None
+        self.frame_id = 0
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self._read_loop, daemon=True)
+
+    def is_opened(self):
+        """Check if the capture device is open."""
+        return self.cap.isOpened()
+
+    def start(self):
+        """Start reading frames in the background."""
+        self.running = True
+        self.thread.start()
+
+    def _read_loop(self):
+        """Keep only the newest frame so slow consumers drop frames instead of lagging."""
+        retry_delay = self.RETRY_DELAY
+        while self.running:
+            ret, frame = self.cap.read()
+            if not ret:
+                # Back off instead of spinning while the camera is unavailable
+                time.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, self.MAX_RETRY_DELAY)
+                continue
+            retry_delay = self.RETRY_DELAY
+            with self.condition:
+                self.frame = frame
+                self.frame_id += 1
+                self.condition.notify_all()
+
+    def read(self, last_id=None, timeout=None):
+        """Return (frame_id, frame) for the newest frame.
+
+        If last_id is given, wait up to timeout seconds for a frame newer than it.
+        The frame is shared between consumers and must not be modified in place.
+        """
+        with self.condition:
+            if last_id is not None:
+                self.condition.wait_for(lambda: self.frame_id != last_id or not self.running, timeout)
+            return self.frame_id, self.frame
+
+    def release(self):
+        """Stop the reader thread and release the capture device."""
+        self.running = False
+        with self.condition:
+            self.condition.notify_all()
+        if self.thread.is_alive():
+            self.thread.join()
+        self.cap.release()
@@ -3,4 +3,5 @@ from client_interface import App
 
 if __name__ == "__main__":
     app = App()
-    app.mainloop()
+    if app.running:
+        app.mainloop()
@@ -1,11 +1,12 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
 import cv2
 import pickle
 import threading
 import struct
 from client_socket import ClientSocket
+from camera_stream import CameraStream
+from frame_renderer import FrameRenderer
 import mediapipe as mp
 import time
 
@@ -20,6 +21,7 @@ class App(tk.Tk):
             "padding": 10
         }
     }
+    RENDER_INTERVAL_MS = 33
 
     def __init__(self, *args, **kwargs):
         """Initialize the application."""
@@ -37,12 +39,19 @@ class App(tk.Tk):
 
         self.image_frame = tk.Frame(self.main_frame, bg="white")
         self.image_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        self.image_frame.pack_propagate(False)
 
         self.button_frame = tk.Frame(self.main_frame, bg="lightgrey")
         self.button_frame.pack(side=tk.BOTTOM, fill=tk.X)
 
-        self.camera_label = tk.Label(self.image_frame)
+        self.camera_label = tk.Label(self.image_frame, borderwidth=0, highlightthickness=0)
         self.camera_label.pack(fill=tk.BOTH, expand=True)
+        self.renderer = FrameRenderer(self.camera_label)
+        self.rendered_frame_id = 0
+
+        # Latest server result, shown on top of the video
+        self.hand_landmarks = None
+        self.last_sign = ""
 
         self.gesture_text = tk.StringVar()
         self.gesture_label = ttk.Label(self.button_frame, textvariable=self.gesture_text)
@@ -56,16 +65,19 @@ class App(tk.Tk):
                                              style="Large.TButton")
         self.translation_button.pack(side=tk.RIGHT, padx=20, pady=10, expand=True)
 
-        self.cap = cv2.VideoCapture(0)
-        if not self.cap.isOpened():
+        self.camera = CameraStream(0)
+        if not self.camera.is_opened():
             messagebox.showerror("Error", "Failed to open camera.")
+            self.running = False
+            self.camera.release()
             self.destroy()
+            return
+        self.camera.start()
 
         self.mp_hands = mp.solutions.hands
+        self.mp_drawing = mp.solutions.drawing_utils
         self.hands = self.mp_hands.Hands()
 
-        self.camera_lock = threading.Lock()
-
         self.update_camera()
 
         self.connect_to_server_thread = threading.Thread(target=self.connect_to_server)
@@ -74,20 +86,31 @@ class App(tk.Tk):
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def update_camera(self):
-        """Update the camera feed."""
-        if self.running:
-            ret, frame = self.cap.read()
-            if ret:
-                try:
-                    with self.camera_lock:
-                        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        img = Image.fromarray(frame_rgb)
-                        imgtk = ImageTk.PhotoImage(image=img)
-                        self.camera_label.imgtk = imgtk
-                        self.camera_label.config(image=imgtk)
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to update camera: {e}")
-            self.after(33, self.update_camera)
+        """Render the newest camera frame, skipping frames the UI could not keep up with."""
+        if not self.running:
+            return
+        started = time.perf_counter()
+        frame_id, frame = self.camera.read()
+        if frame is not None and frame_id != self.rendered_frame_id:
+            try:
+                self.renderer.render(frame, self.draw_overlay)
+                self.rendered_frame_id = frame_id
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to update camera: {e}")
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        self.after(max(1, self.RENDER_INTERVAL_MS - elapsed_ms), self.update_camera)
+
+    def draw_overlay(self, display):
+        """Draw the hand landmarks, recognized sign and render statistics onto the frame."""
+        hand_landmarks = self.hand_landmarks
+        if hand_landmarks:
+            for landmarks in hand_landmarks:
+                self.mp_drawing.draw_landmarks(display, landmarks, self.mp_hands.HAND_CONNECTIONS)
+        if self.last_sign:
+            cv2.putText(display, self.last_sign, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 0), 2)
+        stats = f"{self.renderer.render_fps:.1f} FPS  {self.renderer.cpu_percent:.0f}% CPU"
+        cv2.putText(display, stats, (10, display.shape[0] - 10),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
 
     def connect_to_server(self):
         """Continuously attempt to connect to the server."""
@@ -103,14 +126,17 @@ class App(tk.Tk):
                 except Exception as e:
                     print(f"Error connecting to server: {e}")
                     self.server_connected = False
+                    self.clear_overlay()
             time.sleep(5)  # Wait before trying to reconnect
 
     def send_image_continuously(self):
         """Send camera frames continuously to the server."""
+        frame_id = self.rendered_frame_id
         while self.running and self.server_connected:
             try:
-                ret, frame = self.cap.read()
-                if ret:
+                new_frame_id, frame = self.camera.read(last_id=frame_id, timeout=1.0)
+                if frame is not None and new_frame_id != frame_id:
+                    frame_id = new_frame_id
                     cropped_frame = self.crop_hand_region(frame)
                     if cropped_frame is not None:
                         encoded_frame = pickle.dumps(cropped_frame)
@@ -129,15 +155,18 @@ class App(tk.Tk):
             except (ConnectionResetError, ConnectionAbortedError) as e:
                 print(f"Connection error: {e}")
                 self.server_connected = False
+                self.clear_overlay()
                 self.client_socket.close()
             except Exception as e:
                 if self.running:
                     messagebox.showerror("Error", f"Unexpected error: {e}")
                     self.on_close()
+        self.clear_overlay()
 
     def crop_hand_region(self, frame):
         """Detect hand landmarks and crop the hand region from the frame."""
         results = self.hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        self.hand_landmarks = results.multi_hand_landmarks
         if results.multi_hand_landmarks:
             for hand_landmarks in results.multi_hand_landmarks:
                 x_min = min([lm.x for lm in hand_landmarks.landmark])
@@ -155,10 +184,11 @@ class App(tk.Tk):
     def on_close(self):
         """Handle window close event."""
         self.running = False
+        # Stop the camera first so a send thread waiting for a frame wakes up
+        self.camera.release()
         if self.server_connected:
             self.send_thread.join()
             self.client_socket.close()
-        self.cap.release()
         self.destroy()
 
     def recognition_mode(self):
@@ -172,10 +202,17 @@ class App(tk.Tk):
     def process_received_sign(self, sign):
         """Process the received sign."""
         if sign:
-            self.gesture_text.set(sign.decode())
+            self.last_sign = sign.decode()
+            self.gesture_text.set(self.last_sign)
         else:
+            self.last_sign = ""
             self.gesture_text.set("No sign recognized")
 
+    def clear_overlay(self):
+        """Remove the landmarks and sign of a lost connection from the video."""
+        self.hand_landmarks = None
+        self.last_sign = ""
+
 
 class Mode:
     """Enum-like class to represent application modes."""
@@ -185,4 +222,5 @@ class Mode:
 
 if __name__ == "__main__":
     app = App()
-    app.mainloop()
+    if app.running:
+        app.mainloop()
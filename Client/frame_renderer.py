@@ -0,0 +1,87 @@
+import time
+import cv2
+import numpy as np
+from PIL import Image, ImageTk
+
+
+class FrameRenderer:
+    """A class for drawing BGR frames into a Tk label through one reused PhotoImage."""
+
+    def __init__(self, label):
+        """Attach the renderer to the label and track its size."""
+        self.label = label
+        self.label.bind("<Configure>", self.on_resize)
+
+        # Rendering state reused across frames
+        self.photo = None
+        self.widget_size = None
+        self.display_key = None
+        self.display_size = None
+        self.resize_buffer = None
+        self.rgb_buffer = None
+
+        # Smoothed render statistics
+        self.last_render_time = None
+        self.last_cpu_time = None
+        self.render_fps = 0.0
+        self.cpu_percent = 0.0
+
+    def on_resize(self, event):
+        """Remember the widget size so frames are scaled to fit it."""
+        self.widget_size = (event.width, event.height)
+
+    def get_display_size(self, frame):
+        """Return the frame size that fits the widget, keeping the aspect ratio."""
+        h, w = frame.shape[:2]
+        key = (w, h, self.widget_size)
+        if key != self.display_key:
+            self.display_key = key
+            if self.widget_size is None or min(self.widget_size) <= 1:
+                self.display_size = (w, h)
+            else:
+                scale = min(self.widget_size[0] / w, self.widget_size[1] / h)
+                self.display_size = (max(1, int(w * scale)), max(1, int(h * scale)))
+            self.resize_buffer = None
+            self.rgb_buffer = None
+        return self.display_size
+
+    def render(self, frame, overlay=None):
+        """Scale the frame, draw the overlay and paste it into the shared PhotoImage."""
+        width, height = self.get_display_size(frame)
+        if (width, height) == (frame.shape[1], frame.shape[0]):
+            if self.resize_buffer is None:
+                self.resize_buffer = frame.copy()
+            else:
+                np.copyto(self.resize_buffer, frame)
+            display = self.resize_buffer
+        else:
+            display = cv2.resize(frame, (width, height), dst=self.resize_buffer, interpolation=cv2.INTER_AREA)
+            self.resize_buffer = display
+        if overlay is not None:
+            overlay(display)
+        self.rgb_buffer = cv2.cvtColor(display, cv2.COLOR_BGR2RGB, dst=self.rgb_buffer)
+        img = Image.fromarray(self.rgb_buffer)
+
+        if self.photo is None or (self.photo.width(), self.photo.height()) != (width, height):
+            self.photo = ImageTk.PhotoImage(image=img)
+            self.label.config(image=self.photo)
+        else:
+            self.photo.paste(img)
+
+        self.update_stats()
+
+    def update_stats(self):
+        """Update the smoothed render FPS and process CPU usage."""
+        now = time.perf_counter()
+        cpu_time = time.process_time()
+        if self.last_render_time is not None:
+            elapsed = max(now - self.last_render_time, 1e-6)
+            fps = 1.0 / elapsed
+            cpu_percent = 100.0 * (cpu_time - self.last_cpu_time) / elapsed
+            if self.render_fps == 0.0:
+                self.render_fps, self.cpu_percent = fps, cpu_percent
+            else:
+                self.render_fps = 0.9 * self.render_fps + 0.1 * fps
+                self.cpu_percent = 0.9 * self.cpu_percent + 0.1 * cpu_percent
+        self.last_render_time = now
+        self.last_cpu_time = cpu_time